@@ -1219,7 +1219,6 @@ class TextableGuildChannel(GuildChannel, TextableChannel):
     __slots__: typing.Sequence[str] = ()
 
 
-@attr.define(hash=True, kw_only=True, weakref_slot=False)
 class GuildCategory(GuildChannel):
     """Represents a guild category channel.
 
@@ -1227,6 +1226,8 @@ class GuildCategory(GuildChannel):
     organisation.
     """
 
+    __slots__: typing.Sequence[str] = ()
+
 
 @attr.define(hash=True, kw_only=True, weakref_slot=False)
 class GuildTextChannel(TextableGuildChannel):
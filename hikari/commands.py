@@ -458,11 +458,11 @@ class SlashCommand(PartialCommand):
     """Sequence of up to (and including) 25 of the options for this command."""
 
 
-@attr_extensions.with_copy
-@attr.define(hash=True, kw_only=True, weakref_slot=False)
 class ContextMenuCommand(PartialCommand):
     """Represents a slash command on Discord."""
 
+    __slots__: typing.Sequence[str] = ()
+
 
 class CommandPermissionType(int, enums.Enum):
     """The type of entity a command permission targets."""
@@ -1030,6 +1030,14 @@ class Member(users.User):
         return hash(self.user)
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
+        # Compare against the other member's user directly rather than relying on
+        # the user's __eq__ returning NotImplemented and Python reflecting the call.
+        if isinstance(other, Member):
+            other = other.user
+
         return self.user == other
 
 
@@ -849,7 +849,7 @@ class InteractionAutocompleteBuilder(special_endpoints.InteractionAutocompleteBu
 
 
 @attr_extensions.with_copy
-@attr.define(kw_only=False, weakref_slot=False)
+@attr.define(kw_only=False, on_setattr=attr.setters.NO_OP, weakref_slot=False)
 class InteractionDeferredBuilder(special_endpoints.InteractionDeferredBuilder):
     """Standard implementation of `hikari.api.special_endpoints.InteractionDeferredBuilder`.
 
@@ -893,7 +893,7 @@ class InteractionDeferredBuilder(special_endpoints.InteractionDeferredBuilder):
 
 
 @attr_extensions.with_copy
-@attr.define(kw_only=False, weakref_slot=False)
+@attr.define(kw_only=False, on_setattr=attr.setters.NO_OP, weakref_slot=False)
 class InteractionMessageBuilder(special_endpoints.InteractionMessageBuilder):
     """Standard implementation of `hikari.api.special_endpoints.InteractionMessageBuilder`.
 
@@ -40,22 +40,26 @@ import typing
 import attr
 
 from hikari import channels
-from hikari import commands
-from hikari import snowflakes
 from hikari import traits
 from hikari import undefined
 from hikari.interactions import base_interactions
 from hikari.internal import attr_extensions
 
 if typing.TYPE_CHECKING:
+    from hikari import commands
     from hikari import guilds
     from hikari import locales
     from hikari import messages as messages_
     from hikari import permissions as permissions_
+    from hikari import snowflakes
     from hikari import users as users_
     from hikari.api import special_endpoints
 
 
+_MESSAGE_CREATE_RESPONSE_TYPE: typing.Final = base_interactions.ResponseType.MESSAGE_CREATE
+_DEFERRED_MESSAGE_CREATE_RESPONSE_TYPE: typing.Final = base_interactions.ResponseType.DEFERRED_MESSAGE_CREATE
+
+
 COMMAND_RESPONSE_TYPES: typing.Final[typing.AbstractSet[CommandResponseTypesT]] = frozenset(
     [base_interactions.ResponseType.MESSAGE_CREATE, base_interactions.ResponseType.DEFERRED_MESSAGE_CREATE]
 )
@@ -398,7 +402,7 @@ class CommandInteraction(BaseCommandInteraction, base_interactions.MessageRespon
         hikari.api.special_endpoints.InteractionMessageBuilder
             Interaction message response builder object.
         """
-        return self.app.rest.interaction_message_builder(base_interactions.ResponseType.MESSAGE_CREATE)
+        return self.app.rest.interaction_message_builder(_MESSAGE_CREATE_RESPONSE_TYPE)
 
     def build_deferred_response(self) -> special_endpoints.InteractionDeferredBuilder:
         """Get a deferred message response builder for use in the REST server flow.
@@ -418,7 +422,7 @@ class CommandInteraction(BaseCommandInteraction, base_interactions.MessageRespon
         hikari.api.special_endpoints.InteractionMessageBuilder
             Deferred interaction message response builder object.
         """
-        return self.app.rest.interaction_deferred_builder(base_interactions.ResponseType.DEFERRED_MESSAGE_CREATE)
+        return self.app.rest.interaction_deferred_builder(_DEFERRED_MESSAGE_CREATE_RESPONSE_TYPE)
 
 
 @attr_extensions.with_copy
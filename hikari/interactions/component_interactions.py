@@ -42,13 +42,13 @@ if typing.TYPE_CHECKING:
     from hikari.api import special_endpoints
 
 
-_DEFERRED_TYPES: typing.AbstractSet[_DeferredTypesT] = frozenset(
+_DEFERRED_TYPES: typing.Final[typing.AbstractSet[_DeferredTypesT]] = frozenset(
     [base_interactions.ResponseType.DEFERRED_MESSAGE_CREATE, base_interactions.ResponseType.DEFERRED_MESSAGE_UPDATE]
 )
 _DeferredTypesT = typing.Literal[
     base_interactions.ResponseType.DEFERRED_MESSAGE_CREATE, 5, base_interactions.ResponseType.DEFERRED_MESSAGE_UPDATE, 6
 ]
-_IMMEDIATE_TYPES: typing.AbstractSet[_ImmediateTypesT] = frozenset(
+_IMMEDIATE_TYPES: typing.Final[typing.AbstractSet[_ImmediateTypesT]] = frozenset(
     [base_interactions.ResponseType.MESSAGE_CREATE, base_interactions.ResponseType.MESSAGE_UPDATE]
 )
 _ImmediateTypesT = typing.Literal[
@@ -23,7 +23,7 @@
 """Enum of Discord accepted locales."""
 from __future__ import annotations
 
-__all__ = ["Locale"]
+__all__: typing.Sequence[str] = ("Locale",)
 
 import typing
 
@@ -19,6 +19,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import copy
 import datetime
 
 import mock
@@ -235,6 +236,27 @@ class TestMember:
     def test_str_operator(self, model, mock_user):
         assert str(model) == str(mock_user)
 
+    def test_eq_operator_with_self(self, model):
+        model.user = mock.Mock(__eq__=mock.Mock(return_value=False))
+
+        assert model == model
+
+        model.user.__eq__.assert_not_called()
+
+    @pytest.mark.parametrize("is_equal", [True, False])
+    def test_eq_operator_with_member(self, model, is_equal):
+        model.user = mock.Mock(__eq__=mock.Mock(return_value=is_equal))
+        other = copy.copy(model)
+        other.user = object()
+
+        assert (model == other) is is_equal
+
+        model.user.__eq__.assert_called_once()
+        assert model.user.__eq__.call_args.args[0] is other.user
+
+    def test_eq_operator_with_user(self, model, mock_user):
+        assert model == mock_user
+
     def test_app_property(self, model, mock_user):
         assert model.app is mock_user.app
 